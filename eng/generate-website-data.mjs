@@ -43,6 +43,14 @@ function ensureDataDir() {
   }
 }
 
+/**
+ * Get the repo-relative path of a content directory with forward slashes.
+ * Item paths are built from this prefix instead of calling path.relative per item.
+ */
+function repoRelativeDir(dir) {
+  return path.relative(ROOT_FOLDER, dir).replace(/\\/g, "/");
+}
+
 /**
  * Extract title from filename or frontmatter
  */
@@ -77,12 +85,12 @@ function generateAgentsData(gitDates) {
   const allModels = new Set();
   const allTools = new Set();
 
+  const agentsRelDir = repoRelativeDir(AGENTS_DIR);
+
   for (const file of files) {
     const filePath = path.join(AGENTS_DIR, file);
     const frontmatter = parseFrontmatter(filePath);
-    const relativePath = path
-      .relative(ROOT_FOLDER, filePath)
-      .replace(/\\/g, "/");
+    const relativePath = `${agentsRelDir}/${file}`;
 
     const model = frontmatter?.model || null;
     const tools = frontmatter?.tools || [];
@@ -145,23 +153,23 @@ function generateHooksData(gitDates) {
   }
 
   // Get all hook folders (directories)
-  const hookFolders = fs.readdirSync(HOOKS_DIR).filter((file) => {
-    const filePath = path.join(HOOKS_DIR, file);
-    return fs.statSync(filePath).isDirectory();
-  });
+  const hookFolders = fs
+    .readdirSync(HOOKS_DIR, { withFileTypes: true })
+    .filter((d) => d.isDirectory())
+    .map((d) => d.name);
 
   // Track all unique values for filters
   const allHookTypes = new Set();
   const allTags = new Set();
 
+  const hooksRelDir = repoRelativeDir(HOOKS_DIR);
+
   for (const folder of hookFolders) {
     const hookPath = path.join(HOOKS_DIR, folder);
     const metadata = parseHookMetadata(hookPath);
     if (!metadata) continue;
 
-    const relativePath = path
-      .relative(ROOT_FOLDER, hookPath)
-      .replace(/\\/g, "/");
+    const relativePath = `${hooksRelDir}/${folder}`;
     const readmeRelativePath = `${relativePath}/README.md`;
 
     // Track unique values
@@ -214,14 +222,14 @@ function generateWorkflowsData(gitDates) {
 
   const allTriggers = new Set();
 
+  const workflowsRelDir = repoRelativeDir(WORKFLOWS_DIR);
+
   for (const file of workflowFiles) {
     const filePath = path.join(WORKFLOWS_DIR, file);
     const metadata = parseWorkflowMetadata(filePath);
     if (!metadata) continue;
 
-    const relativePath = path
-      .relative(ROOT_FOLDER, filePath)
-      .replace(/\\/g, "/");
+    const relativePath = `${workflowsRelDir}/${file}`;
 
     (metadata.triggers || []).forEach((t) => allTriggers.add(t));
 
@@ -300,12 +308,12 @@ function generateInstructionsData(gitDates) {
   const allPatterns = new Set();
   const allExtensions = new Set();
 
+  const instructionsRelDir = repoRelativeDir(INSTRUCTIONS_DIR);
+
   for (const file of files) {
     const filePath = path.join(INSTRUCTIONS_DIR, file);
     const frontmatter = parseFrontmatter(filePath);
-    const relativePath = path
-      .relative(ROOT_FOLDER, filePath)
-      .replace(/\\/g, "/");
+    const relativePath = `${instructionsRelDir}/${file}`;
 
     const applyToRaw = frontmatter?.applyTo || null;
     const applyToPatterns = parseApplyToPatterns(applyToRaw);
@@ -409,19 +417,20 @@ function generateSkillsData(gitDates) {
   }
 
   const folders = fs
-    .readdirSync(SKILLS_DIR)
-    .filter((f) => fs.statSync(path.join(SKILLS_DIR, f)).isDirectory());
+    .readdirSync(SKILLS_DIR, { withFileTypes: true })
+    .filter((d) => d.isDirectory())
+    .map((d) => d.name);
 
   const allCategories = new Set();
 
+  const skillsRelDir = repoRelativeDir(SKILLS_DIR);
+
   for (const folder of folders) {
     const skillPath = path.join(SKILLS_DIR, folder);
     const metadata = parseSkillMetadata(skillPath);
 
     if (metadata) {
-      const relativePath = path
-        .relative(ROOT_FOLDER, skillPath)
-        .replace(/\\/g, "/");
+      const relativePath = `${skillsRelDir}/${folder}`;
       const category = categorizeSkill(metadata.name, metadata.description);
       allCategories.add(category);
 
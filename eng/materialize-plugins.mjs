@@ -5,21 +5,23 @@ import path from "path";
 import { ROOT_FOLDER } from "./constants.mjs";
 
 const PLUGINS_DIR = path.join(ROOT_FOLDER, "plugins");
+// Clone via reflink on copy-on-write filesystems (btrfs, XFS); libuv falls
+// back to a regular copy when cloning is not supported.
+const COPY_MODE = fs.constants.COPYFILE_FICLONE;
 
 /**
- * Recursively copy a directory.
+ * Recursively copy a directory, copying sibling entries concurrently.
  */
-function copyDirRecursive(src, dest) {
-  fs.mkdirSync(dest, { recursive: true });
-  for (const entry of fs.readdirSync(src, { withFileTypes: true })) {
+async function copyDirRecursive(src, dest) {
+  await fs.promises.mkdir(dest, { recursive: true });
+  const entries = await fs.promises.readdir(src, { withFileTypes: true });
+  await Promise.all(entries.map((entry) => {
     const srcPath = path.join(src, entry.name);
     const destPath = path.join(dest, entry.name);
-    if (entry.isDirectory()) {
-      copyDirRecursive(srcPath, destPath);
-    } else {
-      fs.copyFileSync(srcPath, destPath);
-    }
-  }
+    return entry.isDirectory()
+      ? copyDirRecursive(srcPath, destPath)
+      : fs.promises.copyFile(srcPath, destPath, COPY_MODE);
+  }));
 }
 
 /**
@@ -41,7 +43,7 @@ function resolveSource(relPath) {
   return null;
 }
 
-function materializePlugins() {
+async function materializePlugins() {
   console.log("Materializing plugin files...\n");
 
   if (!fs.existsSync(PLUGINS_DIR)) {
@@ -77,9 +79,13 @@ function materializePlugins() {
     }
 
     const pluginName = metadata.name || dirName;
+    // Copies for this plugin run concurrently on the libuv threadpool and
+    // are awaited before plugin.json is rewritten.
+    const copies = [];
 
     // Process agents
     if (Array.isArray(metadata.agents)) {
+      const agentCopies = [];
       for (const relPath of metadata.agents) {
         const src = resolveSource(relPath);
         if (!src) {
@@ -93,10 +99,18 @@ function materializePlugins() {
           continue;
         }
         const dest = path.join(pluginPath, relPath.replace(/^\.\//, ""));
-        fs.mkdirSync(path.dirname(dest), { recursive: true });
-        fs.copyFileSync(src, dest);
+        agentCopies.push([src, dest]);
         totalAgents++;
       }
+
+      // Agents share a handful of destination folders; create each one once
+      // up front instead of once per copied file.
+      for (const dir of new Set(agentCopies.map(([, dest]) => path.dirname(dest)))) {
+        fs.mkdirSync(dir, { recursive: true });
+      }
+      for (const [src, dest] of agentCopies) {
+        copies.push(fs.promises.copyFile(src, dest, COPY_MODE));
+      }
     }
 
     // Process skills
@@ -114,11 +128,13 @@ function materializePlugins() {
           continue;
         }
         const dest = path.join(pluginPath, relPath.replace(/^\.\//, "").replace(/\/$/, ""));
-        copyDirRecursive(src, dest);
+        copies.push(copyDirRecursive(src, dest));
         totalSkills++;
       }
     }
 
+    await Promise.all(copies);
+
     // Rewrite plugin.json to use folder paths instead of individual file paths.
     // On staged, paths like ./agents/foo.md point to individual source files.
     // On main, after materialization, we only need the containing directory.
@@ -161,4 +177,7 @@ function materializePlugins() {
   }
 }
 
-materializePlugins();
+materializePlugins().catch((err) => {
+  console.error("Error materializing plugins:", err);
+  process.exit(1);
+});
@@ -470,10 +470,10 @@ function generateHooksSection(hooksDir) {
   }
 
   // Get all hook folders (directories)
-  const hookFolders = fs.readdirSync(hooksDir).filter((file) => {
-    const filePath = path.join(hooksDir, file);
-    return fs.statSync(filePath).isDirectory();
-  });
+  const hookFolders = fs
+    .readdirSync(hooksDir, { withFileTypes: true })
+    .filter((entry) => entry.isDirectory())
+    .map((entry) => entry.name);
 
   // Parse each hook folder
   const hookEntries = hookFolders
@@ -586,10 +586,10 @@ function generateSkillsSection(skillsDir) {
   }
 
   // Get all skill folders (directories)
-  const skillFolders = fs.readdirSync(skillsDir).filter((file) => {
-    const filePath = path.join(skillsDir, file);
-    return fs.statSync(filePath).isDirectory();
-  });
+  const skillFolders = fs
+    .readdirSync(skillsDir, { withFileTypes: true })
+    .filter((entry) => entry.isDirectory())
+    .map((entry) => entry.name);
 
   // Parse each skill folder
   const skillEntries = skillFolders
@@ -106,11 +106,9 @@ function validateSkills() {
   }
 
   const skillFolders = fs
-    .readdirSync(SKILLS_DIR)
-    .filter((file) => {
-      const filePath = path.join(SKILLS_DIR, file);
-      return fs.statSync(filePath).isDirectory();
-    });
+    .readdirSync(SKILLS_DIR, { withFileTypes: true })
+    .filter((entry) => entry.isDirectory())
+    .map((entry) => entry.name);
 
   if (skillFolders.length === 0) {
     console.log("No skill folders found - validation skipped");
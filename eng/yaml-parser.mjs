@@ -5,6 +5,11 @@ import path from "path";
 import { VFile } from "vfile";
 import { matter } from "vfile-matter";
 
+// Same shape as the frontmatter block vfile-matter looks for at the top of a file
+const FRONTMATTER_BLOCK_RE =
+  /^---(?:\r?\n|\r)(?:[\s\S]*?(?:\r?\n|\r))?---(?:\r?\n|\r|$)/;
+const FRONTMATTER_CHUNK_SIZE = 4096;
+
 function safeFileOperation(operation, filePath, defaultValue = null) {
   try {
     return operation();
@@ -14,6 +19,41 @@ function safeFileOperation(operation, filePath, defaultValue = null) {
   }
 }
 
+/**
+ * Read the leading part of a markdown file that holds its frontmatter.
+ * Reading stops once the closing delimiter has been seen (or the file turns
+ * out not to start with frontmatter), so long bodies are never loaded.
+ * @param {string} filePath - Path to the markdown file
+ * @returns {string} File prefix containing the complete frontmatter block
+ */
+function readFrontmatterSource(filePath) {
+  const fd = fs.openSync(filePath, "r");
+  try {
+    const buffer = Buffer.alloc(FRONTMATTER_CHUNK_SIZE);
+    const chunks = [];
+    let content = "";
+    let bytesRead;
+
+    while ((bytesRead = fs.readSync(fd, buffer, 0, buffer.length, null)) > 0) {
+      chunks.push(Buffer.from(buffer.subarray(0, bytesRead)));
+      content = Buffer.concat(chunks).toString("utf8");
+
+      if (content.length >= 3 && !content.startsWith("---")) {
+        break;
+      }
+      // A delimiter matched only via end-of-input may continue in the next chunk
+      const match = FRONTMATTER_BLOCK_RE.exec(content);
+      if (match && /[\r\n]$/.test(match[0])) {
+        break;
+      }
+    }
+
+    return content;
+  } finally {
+    fs.closeSync(fd);
+  }
+}
+
 /**
  * Parse frontmatter from a markdown file using vfile-matter
  * Works with any markdown file that has YAML frontmatter (agents, prompts, instructions)
@@ -23,7 +63,7 @@ function safeFileOperation(operation, filePath, defaultValue = null) {
 function parseFrontmatter(filePath) {
   return safeFileOperation(
     () => {
-      const content = fs.readFileSync(filePath, "utf8");
+      const content = readFrontmatterSource(filePath);
       const file = new VFile({ path: filePath, value: content });
 
       // Parse the frontmatter using vfile-matter
@@ -143,19 +183,19 @@ function parseSkillMetadata(skillPath) {
       }
 
       // List bundled assets (all files except SKILL.md), recursing through subdirectories
-      const getAllFiles = (dirPath, arrayOfFiles = []) => {
-        const files = fs.readdirSync(dirPath);
+      // Relative paths are built with forward slashes for cross-platform consistency
+      const getAllFiles = (dirPath, relDir = "", arrayOfFiles = []) => {
+        const entries = fs.readdirSync(dirPath, { withFileTypes: true });
         const assetPaths = ['references', 'assets', 'scripts'];
 
-        files.forEach((file) => {
-          const filePath = path.join(dirPath, file);
-          if (fs.statSync(filePath).isDirectory() && assetPaths.includes(file)) {
-            arrayOfFiles = getAllFiles(filePath, arrayOfFiles);
+        entries.forEach((entry) => {
+          const filePath = path.join(dirPath, entry.name);
+          const relativePath = relDir ? `${relDir}/${entry.name}` : entry.name;
+          if (entry.isDirectory() && assetPaths.includes(entry.name)) {
+            arrayOfFiles = getAllFiles(filePath, relativePath, arrayOfFiles);
           } else {
-            const relativePath = path.relative(skillPath, filePath);
             if (relativePath !== "SKILL.md") {
-              // Normalize path separators to forward slashes for cross-platform consistency
-              arrayOfFiles.push(relativePath.replace(/\\/g, "/"));
+              arrayOfFiles.push(relativePath);
             }
           }
         });
@@ -219,18 +259,18 @@ function parseHookMetadata(hookPath) {
       }
 
       // List bundled assets (all files except README.md), recursing through subdirectories
-      const getAllFiles = (dirPath, arrayOfFiles = []) => {
-        const files = fs.readdirSync(dirPath);
-
-        files.forEach((file) => {
-          const filePath = path.join(dirPath, file);
-          if (fs.statSync(filePath).isDirectory()) {
-            arrayOfFiles = getAllFiles(filePath, arrayOfFiles);
+      // Relative paths are built with forward slashes for cross-platform consistency
+      const getAllFiles = (dirPath, relDir = "", arrayOfFiles = []) => {
+        const entries = fs.readdirSync(dirPath, { withFileTypes: true });
+
+        entries.forEach((entry) => {
+          const filePath = path.join(dirPath, entry.name);
+          const relativePath = relDir ? `${relDir}/${entry.name}` : entry.name;
+          if (entry.isDirectory()) {
+            arrayOfFiles = getAllFiles(filePath, relativePath, arrayOfFiles);
           } else {
-            const relativePath = path.relative(hookPath, filePath);
             if (relativePath !== "README.md") {
-              // Normalize path separators to forward slashes for cross-platform consistency
-              arrayOfFiles.push(relativePath.replace(/\\/g, "/"));
+              arrayOfFiles.push(relativePath);
             }
           }
         });